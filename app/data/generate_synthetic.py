@@ -1,17 +1,24 @@
 import pandas as pd
 import numpy as np
-import random
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import os
 import argparse
 
 # Argument parsing
 parser = argparse.ArgumentParser(description="Generate synthetic customer data")
 parser.add_argument("--rows", type=int, default=500, help="Number of customers to generate")
+parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible output")
 parser.add_argument("--out", type=str, default=os.environ.get("CUSTOMER_DATA", "app/data/customers.csv"), help="Output CSV file path")
 args = parser.parse_args()
 
 NUM_CUSTOMERS = args.rows
 OUTPUT_PATH = args.out
+PARQUET_PATH = os.path.splitext(OUTPUT_PATH)[0] + ".parquet"
+
+rng = np.random.default_rng(args.seed)
 
 # Region-specific first names
 region_names = {
@@ -28,56 +35,63 @@ region_names = {
 # Common Indian last names
 last_names = ["Sharma", "Verma", "Kumar", "Patel", "Reddy", "Singh", "Nair", "Iyer", "Das", "Ghosh"]
 
-regions = np.random.choice(list(region_names.keys()), size=NUM_CUSTOMERS)
-
-# Prepare empty arrays
-data_gb = np.zeros(NUM_CUSTOMERS)
-minutes = np.zeros(NUM_CUSTOMERS)
-sms = np.zeros(NUM_CUSTOMERS)
-spend = np.zeros(NUM_CUSTOMERS)
+regions = rng.choice(list(region_names.keys()), size=NUM_CUSTOMERS)
 
 # Vectorized generation for each region group
 high_mask = np.isin(regions, ["Delhi", "Mumbai"])
 mid_mask = np.isin(regions, ["Bangalore", "Hyderabad", "Chennai"])
 low_mask = np.isin(regions, ["Kolkata", "Pune", "Ahmedabad"])
 
-# High spend
-data_gb[high_mask] = np.round(np.random.uniform(50, 250, high_mask.sum()), 2)
-minutes[high_mask] = np.round(np.random.uniform(1000, 4000, high_mask.sum()), 2)
-sms[high_mask] = np.round(np.random.uniform(500, 2000, high_mask.sum()), 2)
-spend[high_mask] = np.round(np.random.uniform(799, 1999, high_mask.sum()), 2)
+# Per-tier (low, high) bounds for data_gb, minutes, sms, spend
+tier_low = np.array([
+    [50, 1000, 500, 799],   # High spend
+    [20, 500, 200, 399],    # Mid spend
+    [1, 50, 0, 99],         # Low spend
+], dtype=np.float32)
+tier_high = np.array([
+    [250, 4000, 2000, 1999],
+    [120, 2500, 1200, 1299],
+    [60, 1500, 800, 799],
+], dtype=np.float32)
+tier = np.select([high_mask, mid_mask, low_mask], [0, 1, 2])
 
-# Mid spend
-data_gb[mid_mask] = np.round(np.random.uniform(20, 120, mid_mask.sum()), 2)
-minutes[mid_mask] = np.round(np.random.uniform(500, 2500, mid_mask.sum()), 2)
-sms[mid_mask] = np.round(np.random.uniform(200, 1200, mid_mask.sum()), 2)
-spend[mid_mask] = np.round(np.random.uniform(399, 1299, mid_mask.sum()), 2)
-
-# Low spend
-data_gb[low_mask] = np.round(np.random.uniform(1, 60, low_mask.sum()), 2)
-minutes[low_mask] = np.round(np.random.uniform(50, 1500, low_mask.sum()), 2)
-sms[low_mask] = np.round(np.random.uniform(0, 800, low_mask.sum()), 2)
-spend[low_mask] = np.round(np.random.uniform(99, 799, low_mask.sum()), 2)
+# One (N, 4) uniform draw scaled to each row's tier bounds
+u = rng.random((NUM_CUSTOMERS, 4), dtype=np.float32)
+low = tier_low[tier]
+vals = low + (tier_high[tier] - low) * u
+data_gb, minutes, sms, spend = vals.T
 
 # Generate names vectorized
-names = [
-    f"{random.choice(region_names[region])} {random.choice(last_names)}"
-    for region in regions
-]
+max_first_len = max(len(n) for first_names in region_names.values() for n in first_names)
+first_picks = np.empty(NUM_CUSTOMERS, dtype=f"U{max_first_len}")
+for region, first_names in region_names.items():
+    region_mask = regions == region
+    first_picks[region_mask] = rng.choice(first_names, size=region_mask.sum())
+last_picks = rng.choice(last_names, size=NUM_CUSTOMERS)
+names = np.char.add(np.char.add(first_picks, " "), last_picks)
 
 # Create DataFrame
 df = pd.DataFrame({
-    "customer_id": np.arange(1, NUM_CUSTOMERS + 1),
+    "customer_id": np.arange(1, NUM_CUSTOMERS + 1, dtype=np.int32),
     "name": names,
-    "region": regions,
+    "region": pd.Categorical(regions),
     "avg_monthly_data_gb": data_gb,
     "avg_monthly_minutes": minutes,
     "avg_monthly_sms": sms,
     "avg_monthly_spend": spend
 })
 
+# Round metrics to 2 decimals in Arrow; its CSV writer has no float_format.
+# Widen to float64 first: float32 values print as e.g. 744.04004 in the CSV.
+table = pa.Table.from_pandas(df, preserve_index=False)
+for col in ["avg_monthly_data_gb", "avg_monthly_minutes", "avg_monthly_sms", "avg_monthly_spend"]:
+    rounded = pc.round(table[col].cast(pa.float64()), 2)
+    table = table.set_column(table.schema.get_field_index(col), col, rounded)
+
 # Ensure directory exists
 os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-df.to_csv(OUTPUT_PATH, index=False)
+pacsv.write_csv(table, OUTPUT_PATH)
+# Typed binary copy for faster loading (and smaller to ship); readers prefer it over the CSV
+pq.write_table(table, PARQUET_PATH, compression="zstd", use_dictionary=True)
 
-print(f"Generated {NUM_CUSTOMERS} customers in {OUTPUT_PATH}")
+print(f"Generated {NUM_CUSTOMERS} customers in {OUTPUT_PATH} and {PARQUET_PATH}")
@@ -1,4 +1,8 @@
 # Simple rule-based recommender (placeholder for ML model)
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+
 PLAN_CATALOG = [
     {"name": "Basic", "data_gb": 10, "minutes": 200, "sms": 100, "price": 199},
     {"name": "Standard", "data_gb": 50, "minutes": 1000, "sms": 500, "price": 499},
@@ -6,38 +10,178 @@ PLAN_CATALOG = [
 ]
 
 def recommend_plan(customer: dict):
-    data = float(customer.get("avg_monthly_data_gb", 0))
-    mins = float(customer.get("avg_monthly_minutes", 0))
-    sms  = float(customer.get("avg_monthly_sms", 0))
-    spend = float(customer.get("avg_monthly_spend", 0))
+    return recommend_plan_values(
+        customer.get("customer_id", -1),
+        customer.get("avg_monthly_data_gb", 0),
+        customer.get("avg_monthly_minutes", 0),
+        customer.get("avg_monthly_sms", 0),
+        customer.get("avg_monthly_spend", 0),
+    )
+
+def recommend_plan_values(customer_id, data, mins, sms, spend):
+    """
+    Positional form of recommend_plan, for callers iterating over plain
+    tuples of column values instead of dicts.
+    """
+    shown_data, shown_mins, shown_sms = (_shown_usage(value) for value in (data, mins, sms))
+    data = float(data)
+    mins = float(mins)
+    sms = float(sms)
+    spend = float(spend)
+    plan_idx, savings = _choose_plan(data, mins, sms, spend)
+    plan = PLAN_CATALOG[plan_idx]
+
+    return {
+        "customer_id": int(customer_id),
+        "recommended_plan": plan["name"],
+        "estimated_monthly_bill": plan["price"],
+        "estimated_savings": round(savings, 2),
+        "recommendation_reason": _format_reason(plan_idx, shown_data, shown_mins, shown_sms, spend, savings)
+    }
 
-    # Plan selection rules
+def _shown_usage(value):
+    # float32 values (compact cached columns) are shown at the 2 decimals they
+    # were stored with, not as 76.83000183105469; float64 values as-is
+    if isinstance(value, np.float32):
+        return round(float(value), 2)
+    return float(value)
+
+def _choose_plan(data, mins, sms, spend):
+    """
+    Plan selection rules: returns the PLAN_CATALOG index and the savings
+    (positive means cheaper plan suggested).
+    """
     if data < 8 and mins < 300 and sms < 150:
-        plan = PLAN_CATALOG[0]
+        plan_idx = 0
     elif data < 80 and mins < 1500 and sms < 1000:
-        plan = PLAN_CATALOG[1]
+        plan_idx = 1
     else:
-        plan = PLAN_CATALOG[2]
-
-    # Calculate savings (positive means cheaper plan suggested)
-    savings = spend - plan["price"]
+        plan_idx = 2
+    return plan_idx, spend - PLAN_CATALOG[plan_idx]["price"]
 
-    # Customer-friendly explanation
+def _format_reason(plan_idx, data, mins, sms, spend, savings):
+    """
+    Customer-friendly explanation of a recommendation.
+    """
+    plan = PLAN_CATALOG[plan_idx]
     if savings > 0:
         reason_text = "to save money"
     else:
         reason_text = "for better data benefits and to avoid extra charges"
 
-    recommendation_reason = (
+    return (
         f"Customer currently spends ₹{spend:.0f}/month. "
         f"Based on their usage ({data}GB data, {mins} mins calls, {sms} SMS), "
         f"the {plan['name']} plan at ₹{plan['price']} is recommended {reason_text}."
     )
 
-    return {
-        "customer_id": int(customer.get("customer_id", -1)),
-        "recommended_plan": plan["name"],
-        "estimated_monthly_bill": plan["price"],
-        "estimated_savings": round(savings, 2),
-        "recommendation_reason": recommendation_reason
-    }
+# PLAN_CATALOG flattened to arrays for the batch kernel
+PLAN_NAMES = np.array([p["name"] for p in PLAN_CATALOG], dtype=object)
+PLAN_PRICES = np.array([p["price"] for p in PLAN_CATALOG], dtype=np.int64)
+PLAN_INDEX = {p["name"]: i for i, p in enumerate(PLAN_CATALOG)}
+
+@njit(parallel=True, cache=True)
+def _recommend_batch(data, mins, sms, spend, prices, out_plan_idx, out_savings):
+    """
+    Compiled plan selection over the usage columns (same rules as
+    _choose_plan), writing the chosen catalog index and savings per row.
+    """
+    for i in prange(data.shape[0]):
+        if data[i] < 8 and mins[i] < 300 and sms[i] < 150:
+            p = 0
+        elif data[i] < 80 and mins[i] < 1500 and sms[i] < 1000:
+            p = 1
+        else:
+            p = 2
+        out_plan_idx[i] = p
+        out_savings[i] = spend[i] - prices[p]
+
+@njit(cache=True)
+def _summarize_batch(spend, savings):
+    """
+    Single fused pass over spend and savings: total spend plus count/sum of
+    savings (> 0) and upsell (< 0) opportunities.
+    """
+    total_spend = 0.0
+    savings_count = 0
+    savings_total = 0.0
+    upsell_count = 0
+    upsell_total = 0.0
+    for i in range(savings.shape[0]):
+        total_spend += spend[i]
+        s = savings[i]
+        if s > 0:
+            savings_count += 1
+            savings_total += s
+        elif s < 0:
+            upsell_count += 1
+            upsell_total -= s
+    return total_spend, savings_count, savings_total, upsell_count, upsell_total
+
+def summarize_savings(spend: pd.Series, savings: pd.Series):
+    """
+    Aggregate a frame of recommendations in one pass. Returns
+    (total_spend, savings_count, savings_total, upsell_count, upsell_total),
+    with the upsell total as a positive amount.
+    """
+    total_spend, savings_count, savings_total, upsell_count, upsell_total = _summarize_batch(
+        _usage_array(spend), _usage_array(savings)
+    )
+    return float(total_spend), int(savings_count), float(savings_total), int(upsell_count), float(upsell_total)
+
+def _usage_array(col: pd.Series) -> np.ndarray:
+    # float32/float64 columns are passed through as-is (no upcast copy)
+    if col.dtype in (np.float32, np.float64):
+        return col.to_numpy()
+    return col.to_numpy(dtype=np.float64)
+
+def _shown_usage_column(col: pd.Series) -> list:
+    # Column form of _shown_usage
+    values = _usage_array(col).tolist()
+    if col.dtype == np.float32:
+        return [round(value, 2) for value in values]
+    return values
+
+def recommend_plan_vectorized(df: pd.DataFrame, include_reason: bool = True) -> pd.DataFrame:
+    """
+    Vectorized counterpart of recommend_plan over a customers DataFrame.
+    Returns the recommendation fields as columns aligned to df.index.
+    With include_reason=False the text column is skipped; callers can add it
+    later for just the rows they return via recommendation_reasons().
+    """
+    data = _usage_array(df["avg_monthly_data_gb"])
+    mins = _usage_array(df["avg_monthly_minutes"])
+    sms = _usage_array(df["avg_monthly_sms"])
+    spend = _usage_array(df["avg_monthly_spend"])
+
+    plan_idx = np.empty(len(df), dtype=np.int64)
+    savings = np.empty(len(df), dtype=np.float64)
+    _recommend_batch(data, mins, sms, spend, PLAN_PRICES, plan_idx, savings)
+
+    recs = pd.DataFrame({
+        "recommended_plan": PLAN_NAMES[plan_idx],
+        "estimated_monthly_bill": PLAN_PRICES[plan_idx],
+        "estimated_savings": np.round(savings, 2),
+    }, index=df.index)
+    if include_reason:
+        recs["recommendation_reason"] = recommendation_reasons(df.join(recs))
+    return recs
+
+def recommendation_reasons(df: pd.DataFrame) -> pd.Series:
+    """
+    Format recommend_plan's recommendation_reason for each row of a frame
+    holding the usage columns plus recommended_plan. Meant for the rows a
+    response returns, so it is a plain loop over _format_reason.
+    """
+    columns = (
+        df["recommended_plan"].map(PLAN_INDEX).tolist(),
+        _shown_usage_column(df["avg_monthly_data_gb"]),
+        _shown_usage_column(df["avg_monthly_minutes"]),
+        _shown_usage_column(df["avg_monthly_sms"]),
+        _usage_array(df["avg_monthly_spend"]).tolist(),
+    )
+    reasons = [
+        _format_reason(plan_idx, data, mins, sms, spend, spend - PLAN_CATALOG[plan_idx]["price"])
+        for plan_idx, data, mins, sms, spend in zip(*columns)
+    ]
+    return pd.Series(reasons, index=df.index, dtype=object)
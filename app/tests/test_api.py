@@ -0,0 +1,164 @@
+import json
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import app.main as main
+from app.model.recommender import recommend_plan
+
+
+def make_customers(n=2500, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "customer_id": np.arange(1, n + 1),
+        "name": [f"Customer {i:05d}" for i in rng.permutation(n)],
+        "region": rng.choice(["Delhi", "Pune", "Mumbai"], size=n),
+        "avg_monthly_data_gb": np.round(rng.uniform(1, 150, n), 2),
+        "avg_monthly_minutes": np.round(rng.uniform(50, 3000, n), 2),
+        "avg_monthly_sms": np.round(rng.uniform(10, 1500, n), 2),
+        # Whole rupees from a narrow range, so sorting by spend has many ties
+        "avg_monthly_spend": rng.integers(150, 400, n).astype(float),
+    })
+
+
+def baseline_page(records, args, default_sort, default_order):
+    """
+    The original apply_filters_sort_limit over a list of dicts.
+    """
+    region = args.get("region")
+    if region:
+        records = [r for r in records if r["region"].lower() == region.lower()]
+    sort_col = args.get("sort", default_sort)
+    order = args.get("order", default_order)
+    if records and sort_col in records[0]:
+        records = sorted(records, key=lambda r: r[sort_col], reverse=(order.lower() == "desc"))
+    return records[:int(args.get("limit", 10))], len(records)
+
+
+QUERIES = [
+    {},
+    {"limit": "50"},
+    {"region": "delhi", "limit": "25"},
+    {"region": "PUNE", "sort": "avg_monthly_spend", "order": "desc", "limit": "40"},
+    {"sort": "avg_monthly_spend", "limit": "30"},
+    {"sort": "name", "order": "desc", "limit": "20"},
+    {"sort": "region", "limit": "15"},
+    {"region": "Mumbai", "sort": "customer_id", "order": "desc", "limit": "0"},
+    {"region": "nowhere"},
+    {"limit": "5000"},
+]
+
+
+class TestApi(unittest.TestCase):
+    def setUp(self):
+        self.frame = make_customers()
+        self.version = (1,)
+        self.load_calls = 0
+        self.fail_next_load = False
+
+        def load_customers():
+            self.load_calls += 1
+            if self.fail_next_load:
+                self.fail_next_load = False
+                raise RuntimeError("database unavailable")
+            return self.frame.astype(main.CUSTOMER_DTYPES)
+
+        patches = [
+            mock.patch.object(main, "load_customers_from_db", load_customers),
+            mock.patch.object(main, "get_data_version", lambda: self.version),
+            mock.patch.object(main, "DATA_CHECK_INTERVAL", 0),
+            mock.patch.object(main, "_customers_cache", None),
+            mock.patch.object(main, "_recs_cache", None),
+            mock.patch.object(main, "_data_version", None),
+            mock.patch.object(main, "_data_checked_at", 0.0),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        main._response_cache.clear()
+        self.addCleanup(main._response_cache.clear)
+        self.client = main.app.test_client()
+
+    def query(self, path, args):
+        return self.client.get(path, query_string=args)
+
+    def test_customers_match_baseline(self):
+        records = self.frame.to_dict(orient="records")
+        for args in QUERIES:
+            with self.subTest(args=args):
+                expected, total = baseline_page(records, args, "customer_id", "asc")
+                body = self.query("/customers", args).get_json()
+                assert body["total"] == total
+                assert body["customers"] == expected
+
+    def test_top_savings_and_upsell_match_baseline(self):
+        recs = [{**row, **recommend_plan(row)} for row in self.frame.to_dict(orient="records")]
+        endpoints = [
+            ("/top_savings", "top_savings", "desc", [r for r in recs if r["estimated_savings"] > 0]),
+            ("/top_upsell", "top_upsell", "asc", [r for r in recs if r["estimated_savings"] < 0]),
+        ]
+        for path, key, default_order, records in endpoints:
+            for args in QUERIES:
+                with self.subTest(path=path, args=args):
+                    expected, total = baseline_page(records, args, "estimated_savings", default_order)
+                    body = self.query(path, args).get_json()
+                    assert body["total"] == total
+                    assert [r["customer_id"] for r in body[key]] == [r["customer_id"] for r in expected]
+                    assert [r["recommendation_reason"] for r in body[key]] == [
+                        r["recommendation_reason"] for r in expected
+                    ]
+
+    def test_recommend_matches_scalar(self):
+        row = self.frame.iloc[41].to_dict()
+        body = self.client.get(f"/recommend/{row['customer_id']}").get_json()
+        assert body == recommend_plan(row)
+        assert self.client.get("/recommend/999999").status_code == 404
+
+    def test_large_customers_page_streams_valid_json(self):
+        resp = self.query("/customers", {"limit": "5000", "sort": "avg_monthly_spend"})
+        assert resp.is_streamed
+        body = json.loads(resp.get_data())
+        assert body["total"] == len(self.frame)
+        expected = self.frame.sort_values("avg_monthly_spend", kind="stable")["customer_id"].tolist()
+        assert [r["customer_id"] for r in body["customers"]] == expected
+
+    def test_matching_etag_returns_304(self):
+        first = self.query("/top_savings", {"region": "delhi"})
+        etag = first.headers["ETag"]
+        again = self.query("/top_savings", {"region": "delhi"})
+        assert again.headers["ETag"] == etag
+
+        resp = self.client.get("/top_savings?region=delhi", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        # Flask-Compress tags gzipped variants as "<etag>:gzip"
+        gzip_tag = '"%s:gzip"' % etag.strip('"')
+        resp = self.client.get("/top_savings?region=delhi", headers={"If-None-Match": gzip_tag})
+        assert resp.status_code == 304
+        resp = self.client.get("/top_savings?region=pune", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+
+    def test_cache_invalidated_on_version_change(self):
+        first = self.query("/summary_stats", {"region": "delhi"})
+        assert self.query("/summary_stats", {"region": "delhi"}).get_data() == first.get_data()
+        assert self.load_calls == 1
+
+        self.frame["avg_monthly_spend"] += 1000
+        self.version = (2,)
+        second = self.query("/summary_stats", {"region": "delhi"})
+        assert self.load_calls == 2
+        assert second.headers["ETag"] != first.headers["ETag"]
+        delta = second.get_json()["avg_monthly_spend"] - first.get_json()["avg_monthly_spend"]
+        assert abs(delta - 1000) < 0.01
+
+    def test_failed_load_is_retried(self):
+        self.fail_next_load = True
+        resp = self.client.get("/top_upsell")
+        assert resp.status_code == 404
+        assert "ETag" not in resp.headers
+
+        resp = self.client.get("/top_upsell")
+        assert resp.status_code == 200
+        assert self.load_calls == 2
+        assert resp.get_json()["total"] > 0
@@ -1,5 +1,7 @@
 import unittest
-from app.model.recommender import recommend_plan
+import numpy as np
+import pandas as pd
+from app.model.recommender import recommend_plan, recommend_plan_values, recommend_plan_vectorized, summarize_savings
 
 class TestRecommender(unittest.TestCase):
     def test_basic(self):
@@ -16,3 +18,41 @@ class TestRecommender(unittest.TestCase):
         customer = {'customer_id': 3, 'avg_monthly_data_gb': 120, 'avg_monthly_minutes': 2500, 'avg_monthly_sms': 1200, 'avg_monthly_spend': 1299}
         rec = recommend_plan(customer)
         assert rec['recommended_plan'] == 'Premium'
+
+    def test_positional_matches_dict(self):
+        customer = {'customer_id': 4, 'avg_monthly_data_gb': 60, 'avg_monthly_minutes': 900, 'avg_monthly_sms': 400, 'avg_monthly_spend': 450}
+        rec = recommend_plan_values(4, 60, 900, 400, 450)
+        assert rec == recommend_plan(customer)
+
+    def test_reason_shows_stored_precision(self):
+        rec = recommend_plan_values(5, 7.125, 100, 50, 399)
+        assert '(7.125GB data, 100.0 mins calls, 50.0 SMS)' in rec['recommendation_reason']
+        rec = recommend_plan_values(5, *np.array([76.83, 900, 400.1, 450], dtype=np.float32))
+        assert '(76.83GB data, 900.0 mins calls, 400.1 SMS)' in rec['recommendation_reason']
+
+    def test_vectorized_matches_scalar(self):
+        customers = [
+            {'customer_id': 1, 'avg_monthly_data_gb': 5, 'avg_monthly_minutes': 100, 'avg_monthly_sms': 50, 'avg_monthly_spend': 399},
+            {'customer_id': 2, 'avg_monthly_data_gb': 40, 'avg_monthly_minutes': 800, 'avg_monthly_sms': 300, 'avg_monthly_spend': 399.5},
+            {'customer_id': 3, 'avg_monthly_data_gb': 120.25, 'avg_monthly_minutes': 2500, 'avg_monthly_sms': 1200, 'avg_monthly_spend': 1299.99},
+            {'customer_id': 4, 'avg_monthly_data_gb': 8, 'avg_monthly_minutes': 299.5, 'avg_monthly_sms': 10, 'avg_monthly_spend': 150.1},
+        ]
+        usage_cols = ['avg_monthly_data_gb', 'avg_monthly_minutes', 'avg_monthly_sms', 'avg_monthly_spend']
+        for dtype in ('float64', 'float32'):
+            df = pd.DataFrame(customers).astype({col: dtype for col in usage_cols})
+            recs = recommend_plan_vectorized(df)
+            for (_, row), (_, rec) in zip(df.iterrows(), recs.iterrows()):
+                expected = recommend_plan(row.to_dict())
+                assert rec['recommended_plan'] == expected['recommended_plan']
+                assert rec['estimated_monthly_bill'] == expected['estimated_monthly_bill']
+                assert abs(rec['estimated_savings'] - expected['estimated_savings']) < 1e-9
+                assert rec['recommendation_reason'] == expected['recommendation_reason']
+
+    def test_summarize_savings(self):
+        spend = pd.Series([100.0, 250.5, 300.0, 80.0], dtype='float32')
+        savings = pd.Series([10.0, -20.5, 0.0, 5.25])
+        total_spend, savings_count, savings_total, upsell_count, upsell_total = summarize_savings(spend, savings)
+        assert abs(total_spend - 730.5) < 1e-6
+        assert (savings_count, upsell_count) == (2, 1)
+        assert abs(savings_total - 15.25) < 1e-9
+        assert abs(upsell_total - 20.5) < 1e-9
@@ -0,0 +1,59 @@
+# Gunicorn settings for the container entrypoint:
+#   gunicorn --config gunicorn.conf.py app.main:app
+# Patch before the app (SQLAlchemy, threading) is preloaded in the master
+from gevent import monkey
+monkey.patch_all()
+
+import math
+import multiprocessing
+import os
+
+
+def cpu_limit():
+    """
+    CPUs this container may use: the cgroup (v2 or v1) CPU quota rounded up,
+    or the host CPU count when no quota is set.
+    """
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+    except OSError:
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                quota = f.read().strip()
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = f.read().strip()
+        except OSError:
+            return multiprocessing.cpu_count()
+    if quota in ("max", "-1"):
+        return multiprocessing.cpu_count()
+    return max(1, math.ceil(int(quota) / int(period)))
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+# Each worker holds ~200 MB once pandas/NumPy/pyarrow are loaded, so size by
+# the pod's CPU quota rather than the node's cores
+workers = int(os.environ.get("WEB_CONCURRENCY", cpu_limit()))
+# Split the quota between the workers' Numba thread pools too, instead of a
+# thread per host core in every worker
+os.environ.setdefault("NUMBA_NUM_THREADS", str(max(1, cpu_limit() // workers)))
+# The parallel Numba kernels run in the master (preload) and again in forked
+# workers on reload; workqueue is fork-safe, GNU OpenMP is not. Both must be
+# set before the app imports numba.
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+worker_class = "gevent"
+accesslog = "-"
+# Import the app and load the snapshot once in the master; workers fork
+# afterwards and share the cached frames copy-on-write.
+preload_app = True
+
+
+def on_starting(server):
+    from app.main import load_data
+    load_data()
+
+
+def post_fork(server, worker):
+    # Pooled connections opened by the master must not be reused by workers
+    from app.main import dispose_engine
+    dispose_engine()